@@ -3,6 +3,13 @@ import datetime
 import asyncio
 import random
 import traceback
+from collections import deque
+from itertools import islice
+
+# --- Settings ---
+
+CHART_WINDOW = 60  # Seconds of readings kept on the real-time chart
+HISTORY_PAGE_SIZE = 50  # Sessions rendered per "Load more" page on the history screen
 
 # --- Data Models & State ---
 
@@ -21,8 +28,11 @@ class MonitorState:
         
         # Monitoring Data
         self.heart_rate = 72.0  # Starting BPM value
-        self.history = []       # Stores (time, BPM) for the chart
-        self.logs = []          # Stores alerts and messages
+        self.history = deque(maxlen=CHART_WINDOW)  # Stores (time, BPM) for the chart
+        self.chart_points = deque(maxlen=CHART_WINDOW)  # LineChartDataPoints mirroring history
+        self.logs = deque(maxlen=100)    # Stores alerts and messages
+        self.logs_version = 0            # Bumped every time a log entry is added
+        self.last_log_key = None         # (message, type) of the newest log entry
         self.time_counter = 0   
         self.on_update = None   
         self.heart_scale = 1.0  
@@ -31,83 +41,163 @@ class MonitorState:
         self.is_monitoring = False 
         self.total_time = 0
         self.avg_bpm = 0.0      
-        self.session_readings = []
-        self.history_sessions = [] 
+        self.readings_sum = 0.0
+        self.readings_count = 0
+        self.rendered_logs_version = 0  # logs_version last drawn on the dashboard
+        self.history_sessions = deque(maxlen=200)  # Most recent saved sessions
 
     def log_event(self, message, type="INFO"):
         """Adds a timestamped event to the logs list."""
         now = datetime.datetime.now().strftime("%H:%M:%S")
-        if self.logs and self.logs[0]["message"] == message and self.logs[0]["type"] == type:
+        key = (message, type)
+        if key == self.last_log_key:
             return
-        self.logs.insert(0, {"time": now, "message": message, "type": type})
-        if len(self.logs) > 100:
-            self.logs.pop()
+        self.last_log_key = key
+        self.logs.appendleft({"time": now, "message": message, "type": type})
+        self.logs_version += 1
 
 monitor_state = MonitorState()
 
+# --- Activity Definitions ---
+
+# (Min Base HR, Max Base HR, Momentum, Random Fluctuation Size)
+ACTIVITY_PROFILES = {
+    "Resting": (60, 80, 0.9, 0.5),      
+    "Walking": (90, 110, 0.7, 1.0),
+    "Running": (130, 160, 0.4, 2.0),
+    "Gym": (110, 140, 0.5, 1.5),
+    "Swimming": (100, 130, 0.6, 1.2)
+}
+
+ACTIVITY_ICONS = {"Resting": "spa", "Walking": "directions_walk", "Running": "directions_run", "Gym": "fitness_center", "Swimming": "pool"}
+ACTIVITY_COLORS = {"Resting": "#9C27B0", "Walking": "#4CAF50", "Running": "#FF9800", "Gym": "#F44336", "Swimming": "#2196F3"}
+
+# Per-activity styling with the translucent color variants precomputed
+ACTIVITY_STYLE = {
+    name: {
+        "color": color, "tint": f"{color}30", "fade": f"{color}80",
+        "icon": ACTIVITY_ICONS[name], "icon_color": color, "shadow": color,
+    }
+    for name, color in ACTIVITY_COLORS.items()
+}
+# Monitor page fallback when no known activity is selected (e.g. /monitor opened directly)
+DEFAULT_ACTIVITY_STYLE = {"color": "#444444", "fade": "#66666680", "icon": "circle", "icon_color": "white", "shadow": "black"}
+
+# Log type -> (color, icon, prebuilt border) for the Live Alerts list
+LOG_STYLE = {
+    "ALERT": ("redAccent", "warning", ft.border.all(1, "redAccent30")),
+    "WARNING": ("orangeAccent", "info", ft.border.all(1, "orangeAccent30")),
+    "INFO": ("grey", "circle", ft.border.all(1, "grey30")),
+}
+
+# route -> the stack of views shown for it, bottom first
+ROUTE_STACKS = {
+    "/profile": ("/profile",),
+    "/activity": ("/profile", "/activity"),
+    "/monitor": ("/profile", "/activity", "/monitor"),
+    "/history": ("/profile", "/activity", "/history"),  # Back leads to /activity, not the dashboard
+}
+DEFAULT_ROUTE_STACK = ROUTE_STACKS["/profile"]  # Used for unknown routes such as "/"
+
+# --- Shared Styles ---
+
+# Deep Space Blue/Black Gradient used behind every page
+PAGE_BG_GRADIENT = ft.LinearGradient(
+    begin=ft.alignment.top_center, end=ft.alignment.bottom_center,
+    colors=["#0A1931", "#152238", "#0A1931"],
+)
+CARD_SHADOW = ft.BoxShadow(spread_radius=0, blur_radius=20, color="black26", offset=ft.Offset(0, 10))
+SESSION_SHADOW = ft.BoxShadow(blur_radius=10, color="black26")
+GLASS_BLUR = ft.Blur(10, 10, ft.BlurTileMode.MIRROR)
+GLASS_BORDER = ft.border.all(1, "white10")
+
+# Monitor page stat card backgrounds
+HR_CARD_GRADIENT = ft.LinearGradient(begin=ft.alignment.top_left, end=ft.alignment.bottom_right, colors=["#FF5252", "#D50000"])
+MIN_CARD_GRADIENT = ft.LinearGradient(begin=ft.alignment.top_left, end=ft.alignment.bottom_right, colors=["#00BCD4", "#0097A7"])
+MAX_CARD_GRADIENT = ft.LinearGradient(begin=ft.alignment.top_left, end=ft.alignment.bottom_right, colors=["#E91E63", "#C2185B"])
+AVG_CARD_GRADIENT = ft.LinearGradient(begin=ft.alignment.top_left, end=ft.alignment.bottom_right, colors=["#FFC107", "#FF9800"])
+
 # --- Async Simulation ---
 
 async def run_simulation():
     """Background task to simulate patient vitals using momentum-based randomness."""
     
-    # (Min Base HR, Max Base HR, Momentum, Random Fluctuation Size)
-    activity_profiles = {
-        "Resting": (60, 80, 0.9, 0.5),      
-        "Walking": (90, 110, 0.7, 1.0),
-        "Running": (130, 160, 0.4, 2.0),
-        "Gym": (110, 140, 0.5, 1.5),
-        "Swimming": (100, 130, 0.6, 1.2)
-    }
-    
-    base_hr, target_range, momentum, fluctuation = activity_profiles.get(monitor_state.activity, (70, 100, 0.8, 0.8))
+    # Bind hot names to locals once; the loop body runs every tick
+    state = monitor_state
+    rand = random.random  # C-level [0, 1) draw; cheaper than random.uniform's Python frame
+    uniform = random.uniform
+    log_event = state.log_event
+    history_append = state.history.append
+    chart_points_append = state.chart_points.append
+    data_point = ft.LineChartDataPoint
+
+    base_hr, target_range, momentum, fluctuation = ACTIVITY_PROFILES.get(state.activity, (70, 100, 0.8, 0.8))
+    damping = 1 - momentum
+    target_span = target_range - base_hr
+    fluctuation_span = 2 * fluctuation
+
+    # Schedule ticks against absolute deadlines so the work done each tick doesn't add drift
+    loop = asyncio.get_running_loop()
+    period = 1.0
+    next_tick = loop.time() + period
 
     try:
-        while monitor_state.is_monitoring:
+        while state.is_monitoring:
+            hr = state.heart_rate
             
             # 1. Determine the target HR
-            target_hr = random.uniform(base_hr, target_range)
+            target_hr = base_hr + target_span * rand()
             
             # 2. Add high-frequency noise
-            random_step = random.uniform(-fluctuation, fluctuation)
+            random_step = fluctuation_span * rand() - fluctuation
             
             # 3. Apply momentum (Smooth transition towards the target)
-            monitor_state.heart_rate += (target_hr - monitor_state.heart_rate) * (1 - momentum) + random_step
+            hr += (target_hr - hr) * damping + random_step
             
             # **FIX: Round the heart rate to two decimal places for cleaner display**
-            monitor_state.heart_rate = round(monitor_state.heart_rate, 2)
+            hr = round(hr, 2)
             
             # 4. Enforce boundaries
-            if monitor_state.heart_rate < 40:
-                monitor_state.heart_rate = random.uniform(40, 45)
-                monitor_state.log_event(f"Low HR boundary hit: {int(monitor_state.heart_rate)} bpm", "ALERT")
-            elif monitor_state.heart_rate > 190:
-                monitor_state.heart_rate = random.uniform(180, 190)
-                monitor_state.log_event(f"High HR boundary hit: {int(monitor_state.heart_rate)} bpm", "ALERT")
+            if hr < 40:
+                hr = uniform(40, 45)
+                log_event(f"Low HR boundary hit: {int(hr)} bpm", "ALERT")
+            elif hr > 190:
+                hr = uniform(180, 190)
+                log_event(f"High HR boundary hit: {int(hr)} bpm", "ALERT")
+            state.heart_rate = hr
             
             # 5. Update Session Stats
-            monitor_state.min_bpm = min(monitor_state.min_bpm, monitor_state.heart_rate)
-            monitor_state.max_bpm = max(monitor_state.max_bpm, monitor_state.heart_rate)
+            if hr < state.min_bpm:
+                state.min_bpm = hr
+            if hr > state.max_bpm:
+                state.max_bpm = hr
             
-            monitor_state.session_readings.append(monitor_state.heart_rate)
-            if monitor_state.session_readings:
-                monitor_state.avg_bpm = sum(monitor_state.session_readings) / len(monitor_state.session_readings)
+            state.readings_sum += hr
+            state.readings_count += 1
+            state.avg_bpm = state.readings_sum / state.readings_count
 
             # 6. Update Chart History
-            monitor_state.time_counter += 1
-            monitor_state.total_time += 1
+            time_counter = state.time_counter + 1
+            state.time_counter = time_counter
+            state.total_time += 1
             # Add the new data point, using the rounded value
-            monitor_state.history.append((monitor_state.time_counter, monitor_state.heart_rate))
-            if len(monitor_state.history) > 60: 
-                monitor_state.history.pop(0)
+            history_append((time_counter, hr))
+            chart_points_append(data_point(time_counter, hr))
             
             # 7. Heartbeat Animation
-            monitor_state.heart_scale = 1.2 if monitor_state.heart_scale == 1.0 else 1.0
+            state.heart_scale = 1.2 if state.heart_scale == 1.0 else 1.0
 
             # 8. Refresh UI
-            if monitor_state.on_update:
-                monitor_state.on_update()
+            if state.on_update:
+                state.on_update()
                 
-            await asyncio.sleep(1)
+            delay = next_tick - loop.time()
+            if delay < 0:
+                # Missed the deadline; resync instead of firing a burst of catch-up ticks
+                next_tick = loop.time() + period
+                delay = period
+            next_tick += period
+            await asyncio.sleep(delay)
     except Exception as e:
         print(f"Simulation Error: {e}")
         traceback.print_exc()
@@ -143,31 +233,73 @@ def main(page: ft.Page):
     )
     age_field = ft.TextField(label="Age", hint_text="25", keyboard_type=ft.KeyboardType.NUMBER, border_color="white30", focused_border_color="purpleAccent")
 
+    def build_log_row():
+        """Creates an empty, hidden row for the Live Alerts list."""
+        return ft.Container(
+            content=ft.Row([
+                ft.Icon(size=14),
+                ft.Text(color="grey", font_family="monospace", size=10),
+                ft.Text(color="white", size=11, expand=True),
+            ], spacing=6),
+            padding=8,
+            bgcolor="white05",
+            border_radius=8,
+            visible=False,
+        )
+
+    def fill_log_row(row, log):
+        """Shows a log entry in one of the preallocated Live Alerts rows."""
+        color, icon, border = LOG_STYLE.get(log["type"], LOG_STYLE["INFO"])
+        row_icon, time_text, message_text = row.content.controls
+        row_icon.name = icon
+        row_icon.color = color
+        time_text.value = log["time"]
+        message_text.value = log["message"]
+        row.border = border
+        row.visible = True
+
+    # The Live Alerts list reuses a fixed set of rows that are refilled in place
+    log_rows = [build_log_row() for _ in range(8)]
+    dashboard_log_list.controls = log_rows
+
     # --- UI Update Function ---
     def update_ui():
         """Called every second by the simulation to refresh all display values."""
+        # Nothing to draw while the dashboard isn't the visible page; the next tick catches up
+        if page.route != "/monitor":
+            return
+        
+        # Controls are mutated in place and flushed with a single page.update() at the end
+        dirty = False
+        
+        def set_text(text_control, value):
+            nonlocal dirty
+            if text_control.value != value:
+                text_control.value = value
+                dirty = True
+        
         # Use int() for the main HR display for a clean whole number
-        hr_text.value = f"{int(monitor_state.heart_rate)}" 
+        set_text(hr_text, f"{int(monitor_state.heart_rate)}")
         
-        if monitor_state.min_bpm < 999:
-            min_bpm_text.value = f"{int(monitor_state.min_bpm)}"
-        if monitor_state.max_bpm > 0:
-            max_bpm_text.value = f"{int(monitor_state.max_bpm)}"
-        if monitor_state.session_readings:
-            avg_bpm_text.value = f"{int(monitor_state.avg_bpm)}"
+        if monitor_state.is_monitoring:
+            if monitor_state.min_bpm < 999:
+                set_text(min_bpm_text, f"{int(monitor_state.min_bpm)}")
+            if monitor_state.max_bpm > 0:
+                set_text(max_bpm_text, f"{int(monitor_state.max_bpm)}")
+            if monitor_state.readings_count:
+                set_text(avg_bpm_text, f"{int(monitor_state.avg_bpm)}")
         
         # Update the Line Chart data
         if chart_ref.current:
             try:
-                points = [ft.LineChartDataPoint(x, y) for x, y in monitor_state.history]
-                chart_ref.current.data_series[0].data_points = points
+                chart_ref.current.data_series[0].data_points = list(monitor_state.chart_points)
                 
                 if monitor_state.history:
                     min_x = monitor_state.history[0][0]
                     max_x = monitor_state.history[-1][0]
                     chart_ref.current.min_x = min_x
-                    chart_ref.current.max_x = max(min_x + 60, max_x) 
-                chart_ref.current.update()
+                    chart_ref.current.max_x = max(min_x + CHART_WINDOW, max_x) 
+                dirty = True
             except Exception:
                 pass
         
@@ -175,41 +307,25 @@ def main(page: ft.Page):
         if heart_icon_ref.current:
             try:
                 heart_icon_ref.current.scale = monitor_state.heart_scale
-                heart_icon_ref.current.update()
+                dirty = True
             except Exception:
                 pass
 
-        # Update the Live Alerts log list
-        if page.route == "/monitor":
+        # Refill the alert rows only when new log entries arrived since the last render
+        if monitor_state.logs_version != monitor_state.rendered_logs_version:
             try:
-                dashboard_log_list.controls.clear()
-                for log in monitor_state.logs[:8]:
-                    color = "redAccent" if log["type"] == "ALERT" else "orangeAccent" if log["type"] == "WARNING" else "grey"
-                    icon = "warning" if log["type"] == "ALERT" else "info" if log["type"] == "WARNING" else "circle"
-                    dashboard_log_list.controls.append(
-                        ft.Container(
-                            content=ft.Row([
-                                ft.Icon(icon, color=color, size=14),
-                                ft.Text(log["time"], color="grey", font_family="monospace", size=10),
-                                ft.Text(log["message"], color="white", size=11, expand=True),
-                            ], spacing=6),
-                            padding=8,
-                            bgcolor="white05",
-                            border_radius=8,
-                            border=ft.border.all(1, f"{color}30")
-                        )
-                    )
-                dashboard_log_list.update()
+                for row, log in zip(log_rows, islice(monitor_state.logs, 8)):
+                    fill_log_row(row, log)
+                monitor_state.rendered_logs_version = monitor_state.logs_version
+                dirty = True
             except Exception:
                 pass
 
-        try:
-            hr_text.update()
-            min_bpm_text.update()
-            max_bpm_text.update()
-            avg_bpm_text.update()
-        except Exception:
-            pass 
+        if dirty:
+            try:
+                page.update()
+            except Exception:
+                pass 
 
     monitor_state.on_update = update_ui
 
@@ -223,24 +339,23 @@ def main(page: ft.Page):
         monitor_state.age = age_field.value or "N/A"
         page.go("/activity")
     
-    activity_cards_row = ft.Ref[ft.Row]()
+    activity_card_refs = {}  # activity name -> Ref to its card on the activity page
     measure_button = ft.Ref[ft.ElevatedButton]()
     
     def select_activity(activity_name):
         def handler(e):
+            previous_activity = monitor_state.activity
             monitor_state.activity = activity_name
-            if activity_cards_row.current:
-                activity_cards_row.current.controls = [
-                    build_activity_card("Resting", "spa", "#9C27B0", monitor_state.activity == "Resting"),
-                    build_activity_card("Walking", "directions_walk", "#4CAF50", monitor_state.activity == "Walking"),
-                    build_activity_card("Running", "directions_run", "#FF9800", monitor_state.activity == "Running"),
-                    build_activity_card("Gym", "fitness_center", "#F44336", monitor_state.activity == "Gym"),
-                    build_activity_card("Swimming", "pool", "#2196F3", monitor_state.activity == "Swimming"),
-                ]
-                activity_cards_row.current.update()
+            # Restyle only the deselected and newly selected cards, then send
+            # all changes to the client in a single update
+            if previous_activity != activity_name:
+                for name, is_selected in ((previous_activity, False), (activity_name, True)):
+                    card_ref = activity_card_refs.get(name)
+                    if card_ref and card_ref.current:
+                        style_activity_card(card_ref.current, is_selected)
             if measure_button.current:
                 measure_button.current.disabled = False
-                measure_button.current.update()
+            page.update()
         return handler
     
     def start_monitoring(e):
@@ -250,16 +365,25 @@ def main(page: ft.Page):
             monitor_state.max_bpm = 0.0
             monitor_state.avg_bpm = 0.0
             monitor_state.total_time = 0
-            monitor_state.session_readings = []
-            monitor_state.history = []
+            monitor_state.readings_sum = 0.0
+            monitor_state.readings_count = 0
+            monitor_state.history.clear()
+            monitor_state.chart_points.clear()
             monitor_state.time_counter = 0
-            monitor_state.logs = []
+            monitor_state.logs.clear()
+            monitor_state.last_log_key = None
+            monitor_state.logs_version = 0
+            monitor_state.rendered_logs_version = 0
+            for row in log_rows:
+                row.visible = False
+            # The dashboard shows the profile and activity of the session being started
+            view_cache.pop("/monitor", None)
             page.run_task(run_simulation)
             page.go("/monitor")
     
     def stop_monitoring(e):
         monitor_state.is_monitoring = False
-        if monitor_state.session_readings:
+        if monitor_state.readings_count:
             session_data = {
                 "date": datetime.datetime.now().strftime("%Y-%m-%d %H:%M"),
                 "activity": monitor_state.activity,
@@ -269,6 +393,7 @@ def main(page: ft.Page):
                 "min_bpm": int(monitor_state.min_bpm)
             }
             monitor_state.history_sessions.append(session_data)
+            view_cache.pop("/history", None)
         page.go("/activity")
 
     # --- UI Component Builders ---
@@ -278,35 +403,44 @@ def main(page: ft.Page):
         return ft.Container(
             content=content,
             bgcolor="white10",
-            blur=ft.Blur(10, 10, ft.BlurTileMode.MIRROR),
-            border=ft.border.all(1, "white10"),
+            blur=GLASS_BLUR,
+            border=GLASS_BORDER,
             border_radius=20,
             padding=25,
             height=height,
             expand=expand,
-            shadow=ft.BoxShadow(
-                spread_radius=0, blur_radius=20, color="black26", offset=ft.Offset(0, 10),
-            )
+            shadow=CARD_SHADOW
         )
 
-    def build_activity_card(activity_name, icon, color, is_selected):
+    def style_activity_card(card, is_selected):
+        """Applies the selected/unselected look to an activity card in place."""
+        style = card.data
+        icon, label = card.content.controls
+        icon.color = style["color"] if is_selected else "white70"
+        label.color = "white" if is_selected else "white70"
+        card.bgcolor = style["tint"] if is_selected else "white10"
+        card.border = ft.border.all(3 if is_selected else 1, style["color"] if is_selected else "white10")
+
+    def build_activity_card(activity_name, style, is_selected):
         """Creates a selectable card for different activities."""
-        return ft.Container(
+        card = ft.Container(
+            ref=activity_card_refs.setdefault(activity_name, ft.Ref[ft.Container]()),
             content=ft.Column(
                 [
-                    ft.Icon(icon, size=50, color=color if is_selected else "white70"),
-                    ft.Text(activity_name, size=16, weight="bold", color="white" if is_selected else "white70"),
+                    ft.Icon(style["icon"], size=50),
+                    ft.Text(activity_name, size=16, weight="bold"),
                 ],
                 horizontal_alignment=ft.CrossAxisAlignment.CENTER,
                 spacing=10
             ),
-            bgcolor=f"{color}30" if is_selected else "white10",
-            border=ft.border.all(3 if is_selected else 1, color if is_selected else "white10"),
             border_radius=20,
             padding=30,
             on_click=select_activity(activity_name),
             animate=200,
+            data=style,
         )
+        style_activity_card(card, is_selected)
+        return card
 
     # --- Page Definitions ---
 
@@ -339,10 +473,7 @@ def main(page: ft.Page):
                 horizontal_alignment=ft.CrossAxisAlignment.CENTER,
                 spacing=10
             ),
-            gradient=ft.LinearGradient(
-                begin=ft.alignment.top_center, end=ft.alignment.bottom_center,
-                colors=["#0A1931", "#152238", "#0A1931"], 
-            ),
+            gradient=PAGE_BG_GRADIENT,
             padding=40, expand=True, alignment=ft.alignment.center
         )
 
@@ -353,13 +484,9 @@ def main(page: ft.Page):
                     ft.Row([ft.IconButton("arrow_back", icon_color="white", on_click=lambda _: page.go("/profile")), ft.Text("Select Activity", size=32, weight="bold", color="white")]),
                     ft.Container(height=20),
                     ft.Row(
-                        ref=activity_cards_row,
                         controls=[
-                            build_activity_card("Resting", "spa", "#9C27B0", monitor_state.activity == "Resting"),
-                            build_activity_card("Walking", "directions_walk", "#4CAF50", monitor_state.activity == "Walking"),
-                            build_activity_card("Running", "directions_run", "#FF9800", monitor_state.activity == "Running"),
-                            build_activity_card("Gym", "fitness_center", "#F44336", monitor_state.activity == "Gym"),
-                            build_activity_card("Swimming", "pool", "#2196F3", monitor_state.activity == "Swimming"),
+                            build_activity_card(name, style, monitor_state.activity == name)
+                            for name, style in ACTIVITY_STYLE.items()
                         ],
                         spacing=20, alignment=ft.MainAxisAlignment.CENTER
                     ),
@@ -372,16 +499,12 @@ def main(page: ft.Page):
                 ],
                 horizontal_alignment=ft.CrossAxisAlignment.CENTER, spacing=10
             ),
-            gradient=ft.LinearGradient(
-                begin=ft.alignment.top_center, end=ft.alignment.bottom_center,
-                colors=["#0A1931", "#152238", "#0A1931"], 
-            ),
+            gradient=PAGE_BG_GRADIENT,
             padding=40, expand=True, alignment=ft.alignment.center
         )
 
     def create_monitor_page():
-        activity_icons = {"Resting": "spa", "Walking": "directions_walk", "Running": "directions_run", "Gym": "fitness_center", "Swimming": "pool"}
-        activity_colors = {"Resting": "#9C27B0", "Walking": "#4CAF50", "Running": "#FF9800", "Gym": "#F44336", "Swimming": "#2196F3"}
+        activity_style = ACTIVITY_STYLE.get(monitor_state.activity, DEFAULT_ACTIVITY_STYLE)
         
         return ft.Container(
             content=ft.Row(
@@ -405,33 +528,33 @@ def main(page: ft.Page):
                                 
                                 ft.Container( # Activity Card
                                     content=ft.Column([
-                                        ft.Row([ft.Icon(activity_icons.get(monitor_state.activity, "circle"), color=activity_colors.get(monitor_state.activity, "white"), size=28),
+                                        ft.Row([ft.Icon(activity_style["icon"], color=activity_style["icon_color"], size=28),
                                                 ft.Text(monitor_state.activity, size=20, weight="bold", color="white")]),
                                         ft.Text("Current Activity", color="white54", size=12),
                                     ], spacing=5),
                                     gradient=ft.LinearGradient(
                                         begin=ft.alignment.top_left, end=ft.alignment.bottom_right,
-                                        colors=[activity_colors.get(monitor_state.activity, "#666666") + "80", activity_colors.get(monitor_state.activity, "#444444")],
+                                        colors=[activity_style["fade"], activity_style["color"]],
                                     ),
                                     padding=20, border_radius=20, height=120,
-                                    shadow=ft.BoxShadow(blur_radius=15, color=activity_colors.get(monitor_state.activity, "black"))
+                                    shadow=ft.BoxShadow(blur_radius=15, color=activity_style["shadow"])
                                 ),
                                 ft.Container(height=15),
                                 
                                 # Stat Cards (Min, Max, Avg)
                                 ft.Container(content=ft.Column([ft.Row([ft.Icon("trending_down", color="cyanAccent", size=20), ft.Text("Min BPM", color="white", size=14, weight="bold")]), ft.Row([min_bpm_text, ft.Text("bpm", color="white70", size=12, offset=ft.Offset(0, 0.15))], vertical_alignment=ft.CrossAxisAlignment.END), ft.Text("Lowest recorded", color="white54", size=10)], spacing=5),
-                                    gradient=ft.LinearGradient(begin=ft.alignment.top_left, end=ft.alignment.bottom_right, colors=["#00BCD4", "#0097A7"]), padding=20, border_radius=20, expand=True ),
+                                    gradient=MIN_CARD_GRADIENT, padding=20, border_radius=20, expand=True ),
                                 ft.Container(height=15),
                                 ft.Container(content=ft.Column([ft.Row([ft.Icon("trending_up", color="pinkAccent", size=20), ft.Text("Max BPM", color="white", size=14, weight="bold")]), ft.Row([max_bpm_text, ft.Text("bpm", color="white70", size=12, offset=ft.Offset(0, 0.15))], vertical_alignment=ft.CrossAxisAlignment.END), ft.Text("Highest recorded", color="white54", size=10)], spacing=5),
-                                    gradient=ft.LinearGradient(begin=ft.alignment.top_left, end=ft.alignment.bottom_right, colors=["#E91E63", "#C2185B"]), padding=20, border_radius=20, expand=True),
+                                    gradient=MAX_CARD_GRADIENT, padding=20, border_radius=20, expand=True),
                                 ft.Container(height=15),
                                 ft.Container(content=ft.Column([ft.Row([ft.Icon("equalizer", color="yellowAccent", size=20), ft.Text("Avg BPM", color="white", size=14, weight="bold")]), ft.Row([avg_bpm_text, ft.Text("bpm", color="white70", size=12, offset=ft.Offset(0, 0.15))], vertical_alignment=ft.CrossAxisAlignment.END), ft.Text("Average recorded", color="white54", size=10)], spacing=5),
-                                    gradient=ft.LinearGradient(begin=ft.alignment.top_left, end=ft.alignment.bottom_right, colors=["#FFC107", "#FF9800"]), padding=20, border_radius=20, expand=True),
+                                    gradient=AVG_CARD_GRADIENT, padding=20, border_radius=20, expand=True),
                             ],
                             scroll=ft.ScrollMode.AUTO, spacing=0
                         ),
                         width=600, padding=20,
-                        gradient=ft.LinearGradient(begin=ft.alignment.top_center, end=ft.alignment.bottom_center, colors=["#0A1931", "#152238", "#0A1931"]),
+                        gradient=PAGE_BG_GRADIENT,
                     ),
                     
                     # --- Right Content (BPM Value, Chart, and Logs) ---
@@ -446,7 +569,7 @@ def main(page: ft.Page):
                                         ft.Row([hr_text, ft.Text("bpm", color="white70", size=24, offset=ft.Offset(0, 0.2))], vertical_alignment=ft.CrossAxisAlignment.END, alignment=ft.MainAxisAlignment.CENTER),
                                         ft.Text("Real-time monitoring", color="white54", size=14),
                                     ], horizontal_alignment=ft.CrossAxisAlignment.CENTER, spacing=5),
-                                    gradient=ft.LinearGradient(begin=ft.alignment.top_left, end=ft.alignment.bottom_right, colors=["#FF5252", "#D50000"]),
+                                    gradient=HR_CARD_GRADIENT,
                                     padding=30, border_radius=25, height=220, 
                                 ),
                                 ft.Container(height=20),
@@ -491,7 +614,7 @@ def main(page: ft.Page):
                             spacing=0, expand=True 
                         ),
                         expand=True, padding=20,
-                        gradient=ft.LinearGradient(begin=ft.alignment.top_center, end=ft.alignment.bottom_center, colors=["#0A1931", "#152238", "#0A1931"]),
+                        gradient=PAGE_BG_GRADIENT,
                     )
                 ],
                 spacing=0
@@ -501,34 +624,46 @@ def main(page: ft.Page):
 
     def create_history_page():
         history_list = ft.Column(spacing=15, scroll=ft.ScrollMode.AUTO)
+        load_more_button = ft.TextButton("Load more", on_click=lambda e: show_more_sessions(e))
+        
+        def build_session_row(session):
+            return ft.Container(
+                content=ft.Row([
+                    ft.Container(width=5, bgcolor=ACTIVITY_COLORS.get(session["activity"], "white")),
+                    ft.Column([
+                        ft.Text(f"{session['activity']} Session", size=18, weight="bold", color="white"),
+                        ft.Text(f"Date: {session['date']} | Duration: {session['duration']}", size=12, color="white54"),
+                    ], expand=True),
+                    ft.Column([
+                        ft.Row([ft.Icon("favorite", color="redAccent", size=14), ft.Text(f"Avg: {session['avg_bpm']} BPM", size=14, color="white")]),
+                        ft.Row([ft.Icon("trending_up", color="pinkAccent", size=14), ft.Text(f"Max: {session['max_bpm']} BPM", size=14, color="white")]),
+                        ft.Row([ft.Icon("trending_down", color="cyanAccent", size=14), ft.Text(f"Min: {session['min_bpm']} BPM", size=14, color="white")]),
+                    ], horizontal_alignment=ft.CrossAxisAlignment.END)
+                ], spacing=15),
+                padding=15, bgcolor="white10", border_radius=10,
+                shadow=SESSION_SHADOW
+            )
+        
+        def show_more_sessions(e=None):
+            """Appends the next page of sessions (newest first) below the ones already shown."""
+            sessions = monitor_state.history_sessions
+            controls = history_list.controls
+            if controls and controls[-1] is load_more_button:
+                controls.pop()
+            shown = len(controls)
+            for session in islice(reversed(sessions), shown, shown + HISTORY_PAGE_SIZE):
+                controls.append(build_session_row(session))
+            if len(sessions) > len(controls):
+                controls.append(load_more_button)
+            if e is not None:
+                history_list.update()
         
         def build_history_list():
             history_list.controls.clear()
             if not monitor_state.history_sessions:
                 history_list.controls.append(ft.Text("No sessions recorded yet", color="white70", size=16))
             else:
-                for session in monitor_state.history_sessions:
-                    activity_colors = {"Resting": "#9C27B0", "Walking": "#4CAF50", "Running": "#FF9800", "Gym": "#F44336", "Swimming": "#2196F3"}
-                    
-                    history_list.controls.insert(0,
-                        ft.Container(
-                            content=ft.Row([
-                                ft.Container(width=5, bgcolor=activity_colors.get(session["activity"], "white")),
-                                ft.Column([
-                                    ft.Text(f"{session['activity']} Session", size=18, weight="bold", color="white"),
-                                    ft.Text(f"Date: {session['date']} | Duration: {session['duration']}", size=12, color="white54"),
-                                ], expand=True),
-                                ft.Column([
-                                    ft.Row([ft.Icon("favorite", color="redAccent", size=14), ft.Text(f"Avg: {session['avg_bpm']} BPM", size=14, color="white")]),
-                                    ft.Row([ft.Icon("trending_up", color="pinkAccent", size=14), ft.Text(f"Max: {session['max_bpm']} BPM", size=14, color="white")]),
-                                    ft.Row([ft.Icon("trending_down", color="cyanAccent", size=14), ft.Text(f"Min: {session['min_bpm']} BPM", size=14, color="white")]),
-                                ], horizontal_alignment=ft.CrossAxisAlignment.END)
-                            ], spacing=15),
-                            padding=15, bgcolor="white10", border_radius=10,
-                            shadow=ft.BoxShadow(blur_radius=10, color="black26")
-                        )
-                    )
-            history_list.update()
+                show_more_sessions()
             
         build_history_list()
         
@@ -541,37 +676,55 @@ def main(page: ft.Page):
                 ],
                 expand=True, padding=40
             ),
-            gradient=ft.LinearGradient(begin=ft.alignment.top_center, end=ft.alignment.bottom_center, colors=["#0A1931", "#152238", "#0A1931"]),
+            gradient=PAGE_BG_GRADIENT,
             expand=True
         )
 
     # --- Routing Logic ---
 
+    # route -> View; entries whose content depends on monitor_state are
+    # dropped by the handlers that change that state and rebuilt on next visit
+    view_cache = {}
+
+    # route -> (page factory, view scroll mode)
+    view_factories = {
+        "/profile": (create_profile_page, ft.ScrollMode.AUTO),
+        "/activity": (create_activity_page, ft.ScrollMode.AUTO),
+        "/monitor": (create_monitor_page, None),
+        "/history": (create_history_page, None),
+    }
+
+    def get_view(route):
+        """Returns the cached View for a route, building it on first use."""
+        view = view_cache.get(route)
+        if view is None:
+            factory, scroll = view_factories[route]
+            view = ft.View(route, [factory()], padding=0, scroll=scroll)
+            view_cache[route] = view
+        return view
+
     def route_change(route):
-        page.views.clear()
+        target = ROUTE_STACKS.get(page.route, DEFAULT_ROUTE_STACK)
+        views = page.views
         
-        page.views.append(ft.View("/profile", [create_profile_page()], padding=0, scroll=ft.ScrollMode.AUTO))
+        # Keep the views shared with the target stack and only pop/push the difference
+        keep = 0
+        while keep < len(views) and keep < len(target) and views[keep] is view_cache.get(target[keep]):
+            keep += 1
+        if keep == len(views) == len(target):
+            return
         
-        if page.route == "/activity" or page.route == "/monitor" or page.route == "/history":
-            page.views.append(ft.View("/activity", [create_activity_page()], padding=0, scroll=ft.ScrollMode.AUTO))
-
-        if page.route == "/monitor":
-            page.views.append(ft.View("/monitor", [create_monitor_page()], padding=0))
-
-        if page.route == "/history":
-            if "/activity" not in [v.route for v in page.views]:
-                 page.views.append(ft.View("/activity", [create_activity_page()], padding=0, scroll=ft.ScrollMode.AUTO))
-            if "/monitor" not in [v.route for v in page.views]:
-                 page.views.append(ft.View("/monitor", [create_monitor_page()], padding=0))
-                 
-            page.views.append(ft.View("/history", [create_history_page()], padding=0))
-            
+        del views[keep:]
+        for route_name in target[keep:]:
+            views.append(get_view(route_name))
         page.update()
 
     def view_pop(view):
+        # Popping already leaves the stack in the right shape, so just sync the
+        # route instead of going through route_change again
         page.views.pop()
-        top_view = page.views[-1]
-        page.go(top_view.route)
+        page.route = page.views[-1].route
+        page.update()
 
     page.on_route_change = route_change
     page.on_view_pop = view_pop